@@ -2,8 +2,6 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from desdeo_tools.interaction.request import BaseRequest
-from sklearn.cluster import KMeans
-from sklearn.metrics import pairwise_distances_argmin_min
 
 from desdeo_mcdm.interactive.InteractiveMethod import InteractiveMethod
 
@@ -190,8 +188,8 @@ class ENautilus(InteractiveMethod):
         self._reachable_ub = self._nadir
         self._reachable_lb = self._ideal
 
-        # currently reachable solution as a list of indices of the Pareto front
-        self._reachable_idx = list(range(0, self._pareto_front.shape[0]))
+        # currently reachable solution as an array of indices of the Pareto front
+        self._reachable_idx = np.arange(self._pareto_front.shape[0])
 
         # current iteration step number
         self._step_number = 1
@@ -232,14 +230,7 @@ class ENautilus(InteractiveMethod):
         # self._intermediate_points = np.repeat(np.atleast_2d(self._nadir), self._n_points, axis=0)
         self._preferred_point = self._nadir
 
-        zbars = self.calculate_representative_points(self._pareto_front, self._reachable_idx, self._n_points)
-        zs = self.calculate_intermediate_points(self._preferred_point, zbars, self._n_iterations_left)
-        new_lower_bounds, new_upper_bounds = self.calculate_bounds(self._pareto_front, zs)
-        distances = self.calculate_distances(zs, zbars, self._nadir)
-
-        return ENautilusRequest(
-            self._ideal, self._nadir, zs, new_lower_bounds, new_upper_bounds, distances, self._minimize
-        )
+        return self.request_intermediate_points()
 
     def handle_request(self, request: ENautilusRequest) -> Union[ENautilusRequest, ENautilusStopRequest]:
         """Handles the intermediate requests.
@@ -265,6 +256,14 @@ class ENautilus(InteractiveMethod):
         self._step_number += 1
 
         # Start again
+        return self.request_intermediate_points()
+
+    def request_intermediate_points(self) -> ENautilusRequest:
+        """Computes new intermediate points, and their bounds and distances, based on the current state.
+
+        Returns:
+            ENautilusRequest: A request with the new intermediate points for the decision maker to choose from.
+        """
         zbars = self.calculate_representative_points(self._pareto_front, self._reachable_idx, self._n_points)
         zs = self.calculate_intermediate_points(self._preferred_point, zbars, self._n_iterations_left)
         new_lower_bounds, new_upper_bounds = self.calculate_bounds(self._pareto_front, zs)
@@ -292,6 +291,10 @@ class ENautilus(InteractiveMethod):
             the subset of the Pareto front.
         """
         if len(np.atleast_1d(subset_indices)) > n_points:
+            # sklearn is slow to import and only needed when clustering
+            from sklearn.cluster import KMeans
+            from sklearn.metrics import pairwise_distances_argmin_min
+
             kmeans = KMeans(n_clusters=n_points)
             kmeans.fit(pareto_front[subset_indices])
 
@@ -334,32 +337,31 @@ class ENautilus(InteractiveMethod):
             Tuple[np.ndarray, np.ndarray]: The lower and upper bounds for each of the intermediate points.
         """
         _pareto_front = np.atleast_2d(pareto_front)
-        n_points = np.atleast_2d(intermediate_points).shape[0]
-        new_lower_bounds = np.zeros((n_points, _pareto_front.shape[1]))
-        new_upper_bounds = np.zeros((n_points, _pareto_front.shape[1]))
-
-        for i, point in enumerate(np.atleast_2d(intermediate_points)):
-            # TODO: vectorize this loop
-            for r in range(_pareto_front.shape[1]):
-                mask = np.zeros(_pareto_front.shape[1], dtype=bool)
-                mask[r] = True
+        _intermediate_points = np.atleast_2d(intermediate_points)
 
-                subject_to = _pareto_front[:, ~mask].reshape((_pareto_front.shape[0], _pareto_front.shape[1] - 1))
+        # mark the objectives in which each point on the front exceeds each of the intermediate points,
+        # the first axis corresponds to the intermediate points, and the second to the points on the front
+        exceeds = ~(_pareto_front[np.newaxis, :, :] <= _intermediate_points[:, np.newaxis, :])
+        n_exceeds = np.sum(exceeds, axis=2, keepdims=True)
 
-                con_mask = np.all(subject_to <= point[~mask], axis=1)
+        # a point on the front bounds the r:th objective when it does not exceed the intermediate point in
+        # any of the other objectives
+        con_mask = (n_exceeds - exceeds) == 0
 
-                min_val = np.min(_pareto_front[con_mask, mask])
-                max_val = np.max(_pareto_front[con_mask, mask])
+        if not np.all(np.any(con_mask, axis=1)):
+            raise ENautilusException(
+                "No point on the Pareto front is reachable from some of the intermediate points in some of the "
+                "objectives."
+            )
 
-                new_lower_bounds[i, r] = min_val
-                new_upper_bounds[i, r] = max_val
+        # broadcast the front as a view instead of building filled copies of it
+        _pareto_fronts = np.broadcast_to(_pareto_front, con_mask.shape)
+        new_lower_bounds = np.min(_pareto_fronts, axis=1, where=con_mask, initial=np.inf)
+        new_upper_bounds = np.max(_pareto_fronts, axis=1, where=con_mask, initial=-np.inf)
 
         return new_lower_bounds, new_upper_bounds
 
     def calculate_distances(self, intermediate_points: np.ndarray, zbars: np.ndarray, nadir: np.ndarray) -> np.ndarray:
-        distances = np.linalg.norm(np.atleast_2d(intermediate_points) - nadir, axis=1) / np.linalg.norm(
-            np.atleast_2d(zbars) - nadir, axis=1
-        )
         """Calculates the distance to the Pareto front for each intermediate
         point given utilizing representative points representing the
         intermediate points.
@@ -372,7 +374,14 @@ class ENautilus(InteractiveMethod):
         Returns:
             np.ndarray: The distances calculated for each intermediate point to the Pareto front.
         """
-        return distances * 100
+        diff_points = intermediate_points - nadir
+        diff_zbars = zbars - nadir
+
+        # row-wise Euclidean norms without allocating the squared differences
+        nom = np.sqrt(np.einsum("...i,...i->...", diff_points, diff_points))
+        denom = np.sqrt(np.einsum("...i,...i->...", diff_zbars, diff_zbars))
+
+        return np.atleast_1d(nom / denom) * 100
 
     def calculate_reachable_point_indices(
         self, pareto_front: np.ndarray, lower_bounds: np.ndarray, upper_bounds: np.ndarray,
@@ -389,42 +398,3 @@ class ENautilus(InteractiveMethod):
         reachable_idx = np.argwhere(low_idx & up_idx).squeeze()
 
         return reachable_idx
-
-
-if __name__ == "__main__":
-    # front = np.array([[1, 2, 3], [2, 3, 4], [2, 2, 3], [3, 2, 1]], dtype=float)
-    # ideal = np.zeros(3)
-    # nadir = np.ones(3) * 5
-    f1 = np.linspace(1, 100, 50)
-    f2 = f1[::-1] ** 2
-
-    front = np.stack((f1, f2)).T
-    ideal = np.min(front, axis=0)
-    nadir = np.max(front, axis=0)
-
-    method = ENautilus((front), ideal, nadir)
-
-    req = method.start()
-
-    n_iterations = 11
-    n_points = 4
-
-    req.response = {
-        "n_iterations": n_iterations,
-        "n_points": n_points,
-    }
-
-    req = method.iterate(req)
-    req.response = {"preferred_point_index": 0}
-
-    while method._n_iterations_left > 1:
-        print(method._n_iterations_left)
-        req = method.iterate(req)
-        print(req.content["points"])
-        req.response = {"preferred_point_index": 0}
-
-    print(method._n_iterations_left)
-    req = method.iterate(req)
-    print(method._n_iterations_left)
-    print(method._distance)
-    print(req.content["solution"])
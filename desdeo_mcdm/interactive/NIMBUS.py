@@ -11,7 +11,7 @@ from desdeo_tools.scalarization.Scalarizer import Scalarizer
 from desdeo_tools.solver.ScalarSolver import ScalarMethod, ScalarMinimizer
 
 from desdeo_mcdm.interactive.InteractiveMethod import InteractiveMethod
-from desdeo_mcdm.utilities.solvers import payoff_table_method
+from desdeo_mcdm.utilities.solvers import CachedEvaluator, payoff_table_method
 
 
 class NimbusException(Exception):
@@ -85,34 +85,32 @@ class NimbusClassificationRequest(BaseRequest):
             raise NimbusException("'number_of_solutions' entry missing.")
 
         # check the classifications
-        is_valid_cls = map(lambda x: x in self._valid_classifications, response["classifications"],)
-
-        if not all(list(is_valid_cls)):
+        if not all(c in self._valid_classifications for c in response["classifications"]):
             raise NimbusException(f"Invalid classificaiton found in {response['classifications']}")
 
+        # convert the levels and classifications to arrays only once
+        levels = np.asarray(response["levels"])
+        classifications = np.asarray(response["classifications"])
+
         # check the levels
-        if len(np.array(response["levels"]).squeeze()) != self._method._problem.n_of_objectives:
+        if len(levels.squeeze()) != self._method._problem.n_of_objectives:
             raise NimbusException(f"Wrong number of levels supplied in {response['levels']}")
 
-        improve_until_inds = np.where(np.array(response["classifications"]) == "<=")[0]
+        improve_until_inds = np.where(classifications == "<=")[0]
 
-        impaire_until_inds = np.where(np.array(response["classifications"]) == ">=")[0]
+        impaire_until_inds = np.where(classifications == ">=")[0]
 
         if len(improve_until_inds) > 0:
             # some objectives classified to be improved until some level
-            if not np.all(
-                np.array(response["levels"])[improve_until_inds] >= self._method._ideal[improve_until_inds]
-            ) or not np.all(
-                np.array(response["levels"])[improve_until_inds] <= self._method._nadir[improve_until_inds]
+            if not np.all(levels[improve_until_inds] >= self._method._ideal[improve_until_inds]) or not np.all(
+                levels[improve_until_inds] <= self._method._nadir[improve_until_inds]
             ):
                 raise NimbusException("Given levels must be between the nadir and ideal points!")
 
         if len(impaire_until_inds) > 0:
             # some objectives classified to be improved until some level
-            if not np.all(
-                np.array(response["levels"])[impaire_until_inds] >= self._method._ideal[impaire_until_inds]
-            ) or not np.all(
-                np.array(response["levels"])[impaire_until_inds] <= self._method._nadir[impaire_until_inds]
+            if not np.all(levels[impaire_until_inds] >= self._method._ideal[impaire_until_inds]) or not np.all(
+                levels[impaire_until_inds] <= self._method._nadir[impaire_until_inds]
             ):
                 raise NimbusException("Given levels must be between the nadir and ideal points!")
 
@@ -374,16 +372,23 @@ class NIMBUS(InteractiveMethod):
 
         self._scalar_method = scalar_method
 
+        # the ASFs depending only on the ideal and nadir points can be shared between iterations
+        self._point_method_asf = PointMethodASF(self._nadir, self._ideal)
+        self._stom_asf = StomASF(self._ideal)
+
+        # caches the most recent evaluations of the problem
+        self._evaluator = CachedEvaluator(problem)
+
+        super().__init__(problem)
+
         # generate Pareto optimal starting point
         asf = SimpleASF(np.ones(self._ideal.shape))
         scalarizer = Scalarizer(
-            lambda x: problem.evaluate(x).objectives,
-            asf,
-            scalarizer_args={"reference_point": np.atleast_2d(self._ideal)},
+            self._evaluator.objectives, asf, scalarizer_args={"reference_point": np.atleast_2d(self._ideal)},
         )
 
         if problem.n_of_constraints > 0:
-            _con_eval = lambda x: problem.evaluate(x).constraints.squeeze()
+            _con_eval = self._evaluator.constraints
         else:
             _con_eval = None
 
@@ -397,14 +402,13 @@ class NIMBUS(InteractiveMethod):
 
         if res["success"]:
             self._current_solution = res["x"]
-            self._current_objectives = problem.evaluate(self._current_solution).objectives.squeeze()
+            # copied, since the cached evaluations are read-only
+            self._current_objectives = self._evaluator.objectives(self._current_solution).squeeze().copy()
 
         self._archive_solutions = []
         self._archive_objectives = []
         self._state = "classify"
 
-        super().__init__(problem)
-
     def start(self) -> Tuple[NimbusClassificationRequest, SimplePlotRequest]:
         """Return the first request to start iterating NIMBUS.
         
@@ -456,15 +460,17 @@ class NIMBUS(InteractiveMethod):
             Tuple[NimbusSaveRequest, SimplePlotRequest]: A NIMBUS save request and a plot request
             with the solutions the decision maker can choose from to save for alter use.
         """
-        improve_inds = np.where(np.array(request.response["classifications"]) == "<")[0]
+        classifications = np.asarray(request.response["classifications"])
 
-        acceptable_inds = np.where(np.array(request.response["classifications"]) == "=")[0]
+        improve_inds = np.where(classifications == "<")[0]
 
-        free_inds = np.where(np.array(request.response["classifications"]) == "0")[0]
+        acceptable_inds = np.where(classifications == "=")[0]
 
-        improve_until_inds = np.where(np.array(request.response["classifications"]) == "<=")[0]
+        free_inds = np.where(classifications == "0")[0]
 
-        impaire_until_inds = np.where(np.array(request.response["classifications"]) == ">=")[0]
+        improve_until_inds = np.where(classifications == "<=")[0]
+
+        impaire_until_inds = np.where(classifications == ">=")[0]
 
         # calculate the new solutions
         return self.calculate_new_solutions(
@@ -616,30 +622,31 @@ class NIMBUS(InteractiveMethod):
         # two supplied solutions
         step_size = norm / (2 + n_desired)
 
-        intermediate_points = np.array([solutions[1] + i * step_size * between_norm for i in range(1, n_desired + 1)])
+        steps = np.arange(1, n_desired + 1).reshape(-1, 1)
+        intermediate_points = solutions[1] + steps * step_size * between_norm
 
         # project each of the intermediate solutions to the Pareto front
         intermediate_solutions = np.zeros(intermediate_points.shape)
         intermediate_objectives = np.zeros((n_desired, self._problem.n_of_objectives))
-        asf = PointMethodASF(self._nadir, self._ideal)
+        asf = self._point_method_asf
 
-        for i in range(n_desired):
-            scalarizer = Scalarizer(
-                lambda x: self._problem.evaluate(x).objectives,
-                asf,
-                scalarizer_args={"reference_point": self._problem.evaluate(intermediate_points[i]).objectives},
-            )
+        # only the reference point changes between the projections
+        scalarizer = Scalarizer(self._evaluator.objectives, asf, scalarizer_args={"reference_point": None})
 
-            if self._problem.n_of_constraints > 0:
-                cons = lambda x: self._problem.evaluate(x).constraints.squeeze()
-            else:
-                cons = None
+        if self._problem.n_of_constraints > 0:
+            cons = self._evaluator.constraints
+        else:
+            cons = None
+
+        solver = ScalarMinimizer(scalarizer, self._problem.get_variable_bounds(), cons, method=self._scalar_method,)
 
-            solver = ScalarMinimizer(scalarizer, self._problem.get_variable_bounds(), cons, method=self._scalar_method,)
+        for i in range(n_desired):
+            scalarizer._scalarizer_args = {"reference_point": self._evaluator.objectives(intermediate_points[i])}
 
-            res = solver.minimize(self._current_solution)
+            # the intermediate point is already close to its projection, start from it
+            res = solver.minimize(intermediate_points[i])
             intermediate_solutions[i] = res["x"]
-            intermediate_objectives[i] = self._problem.evaluate(res["x"]).objectives
+            intermediate_objectives[i] = self._evaluator.objectives(res["x"])
 
         # create appropiate requests
         save_request = NimbusSaveRequest(list(intermediate_solutions), list(intermediate_objectives))
@@ -717,32 +724,35 @@ class NIMBUS(InteractiveMethod):
         # always computed
         asf_1 = MaxOfTwoASF(self._nadir, self._ideal, improve_inds, improve_until_inds)
 
+        # the current values of the objectives to be improved are sliced only once
+        improve_all_inds = np.concatenate((improve_inds, improve_until_inds)).astype(int)
+        f_current_improve = self._current_objectives[improve_all_inds]
+
         def cons_1(
             x: np.ndarray,
-            f_current: np.ndarray = self._current_objectives,
             levels: np.ndarray = levels,
-            improve_until_inds: np.ndarray = improve_until_inds,
-            improve_inds: np.ndarray = improve_inds,
+            improve_all_inds: np.ndarray = improve_all_inds,
+            f_current_improve: np.ndarray = f_current_improve,
             impaire_until_inds: np.ndarray = impaire_until_inds,
         ):
-            f = self._problem.evaluate(x).objectives.squeeze()
-
-            res_1 = f_current[improve_inds] - f[improve_inds]
-            res_2 = f_current[improve_until_inds] - f[improve_until_inds]
-            res_3 = levels[impaire_until_inds] - f_current[impaire_until_inds]
+            # evaluate the problem only once, both the objectives and constraints are needed
+            evaluated = self._evaluator.evaluate(x)
+            f = evaluated.objectives.squeeze()
 
-            res = np.hstack((res_1, res_2, res_3))
+            res_improve = f_current_improve - f[improve_all_inds]
+            res_impaire = levels[impaire_until_inds] - f[impaire_until_inds]
 
+            # stack everything in one go instead of building an intermediate array
             if self._problem.n_of_constraints > 0:
-                res_prob = self._problem.evaluate(x).constraints.squeeze()
+                res_prob = evaluated.constraints.squeeze()
 
-                return np.hstack((res_prob, res))
+                return np.hstack((res_prob, res_improve, res_impaire))
 
             else:
-                return res
+                return np.hstack((res_improve, res_impaire))
 
         scalarizer_1 = Scalarizer(
-            lambda x: self._problem.evaluate(x).objectives, asf_1, scalarizer_args={"reference_point": levels},
+            self._evaluator.objectives, asf_1, scalarizer_args={"reference_point": levels},
         )
 
         solver_1 = ScalarMinimizer(
@@ -762,16 +772,16 @@ class NIMBUS(InteractiveMethod):
             z_bar[free_inds] = self._nadir[free_inds]
 
             # second ASF
-            asf_2 = StomASF(self._ideal)
+            asf_2 = self._stom_asf
 
             # cons_2 can be used in the rest of the ASF scalarizations, it's not a bug!
             if self._problem.n_of_constraints > 0:
-                cons_2 = lambda x: self._problem.evaluate(x).constraints.squeeze()
+                cons_2 = self._evaluator.constraints
             else:
                 cons_2 = None
 
             scalarizer_2 = Scalarizer(
-                lambda x: self._problem.evaluate(x).objectives, asf_2, scalarizer_args={"reference_point": z_bar},
+                self._evaluator.objectives, asf_2, scalarizer_args={"reference_point": z_bar},
             )
 
             solver_2 = ScalarMinimizer(
@@ -783,10 +793,10 @@ class NIMBUS(InteractiveMethod):
 
         if number_of_solutions > 2:
             # asf 3
-            asf_3 = PointMethodASF(self._nadir, self._ideal)
+            asf_3 = self._point_method_asf
 
             scalarizer_3 = Scalarizer(
-                lambda x: self._problem.evaluate(x).objectives, asf_3, scalarizer_args={"reference_point": z_bar},
+                self._evaluator.objectives, asf_3, scalarizer_args={"reference_point": z_bar},
             )
 
             solver_3 = ScalarMinimizer(
@@ -801,7 +811,7 @@ class NIMBUS(InteractiveMethod):
             asf_4 = AugmentedGuessASF(self._nadir, self._ideal, free_inds)
 
             scalarizer_4 = Scalarizer(
-                lambda x: self._problem.evaluate(x).objectives, asf_4, scalarizer_args={"reference_point": z_bar},
+                self._evaluator.objectives, asf_4, scalarizer_args={"reference_point": z_bar},
             )
 
             solver_4 = ScalarMinimizer(
@@ -813,7 +823,8 @@ class NIMBUS(InteractiveMethod):
 
         # create the save request
         solutions = [res["x"] for res in results]
-        objectives = [self._problem.evaluate(x).objectives.squeeze() for x in solutions]
+        # copied, since the request content is handed to the caller and the cached evaluations are read-only
+        objectives = [self._evaluator.objectives(x).squeeze().copy() for x in solutions]
 
         save_request = NimbusSaveRequest(solutions, objectives)
 
@@ -924,69 +935,3 @@ class NIMBUS(InteractiveMethod):
         else:
             # unknown state error
             raise NimbusException(f"Unknown state '{self._state}' encountered.")
-
-
-if __name__ == "__main__":
-    from desdeo_problem.Objective import _ScalarObjective
-    from desdeo_problem.Variable import variable_builder
-    from desdeo_problem.Constraint import ScalarConstraint
-
-    # create the problem
-    def f_1(x):
-        res = 4.07 + 2.27 * x[:, 0]
-        return -res
-
-    def f_2(x):
-        res = 2.60 + 0.03 * x[:, 0] + 0.02 * x[:, 1] + 0.01 / (1.39 - x[:, 0] ** 2) + 0.30 / (1.39 - x[:, 1] ** 2)
-        return -res
-
-    def f_3(x):
-        res = 8.21 - 0.71 / (1.09 - x[:, 0] ** 2)
-        return -res
-
-    def f_4(x):
-        res = 0.96 - 0.96 / (1.09 - x[:, 1] ** 2)
-        return -res
-
-    def f_5(x):
-        return np.max([np.abs(x[:, 0] - 0.65), np.abs(x[:, 1] - 0.65)], axis=0)
-
-    def c_1(x, f=None):
-        x = x.squeeze()
-        return (x[0] + x[1]) - 0.5
-
-    f1 = _ScalarObjective(name="f1", evaluator=f_1)
-    f2 = _ScalarObjective(name="f2", evaluator=f_2)
-    f3 = _ScalarObjective(name="f3", evaluator=f_3)
-    f4 = _ScalarObjective(name="f4", evaluator=f_4)
-    f5 = _ScalarObjective(name="f5", evaluator=f_5)
-    varsl = variable_builder(
-        ["x_1", "x_2"], initial_values=[0.5, 0.5], lower_bounds=[0.3, 0.3], upper_bounds=[1.0, 1.0],
-    )
-    c1 = ScalarConstraint("c1", 2, 5, evaluator=c_1)
-    problem = MOProblem(variables=varsl, objectives=[f1, f2, f3, f4, f5], constraints=[c1])
-
-    method = NIMBUS(problem, scalar_method="scipy_de")
-    reqs = method.request_classification()[0]
-
-    response = {}
-    response["classifications"] = ["<", "<=", "=", ">=", "0"]
-    response["levels"] = [-6, -3, -5, 8, 0.349]
-    response["number_of_solutions"] = 3
-    reqs.response = response
-    res_1 = method.iterate(reqs)[0]
-    res_1.response = {"indices": []}
-
-    res_2 = method.iterate(res_1)[0]
-    response = {}
-    response["indices"] = []
-    response["number_of_desired_solutions"] = 0
-    res_2.response = response
-
-    res_3 = method.iterate(res_2)[0]
-    response_pref = {}
-    response_pref["index"] = 1
-    response_pref["continue"] = True
-    res_3.response = response_pref
-
-    res_4 = method.iterate(res_3)
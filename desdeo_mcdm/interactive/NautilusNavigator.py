@@ -1,7 +1,6 @@
 from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 
 from desdeo_mcdm.interactive.InteractiveMethod import InteractiveMethod
 from desdeo_tools.interaction.request import BaseRequest, SimplePlotRequest
@@ -113,15 +112,15 @@ class NautilusNavigatorRequest(BaseRequest):
             )
 
         if not type(response["go_to_previous"]) == bool:
-            raise (
+            raise NautilusNavigatorException(
                 f"Non boolean value {response['go_to_previous']} "
-                f"found for 'go_to_previous' when validating the response."
+                "found for 'go_to_previous' when validating the response."
             )
 
         if not type(response["stop"]) == bool:
-            raise (
+            raise NautilusNavigatorException(
                 f"Non boolean value {response['stop']} "
-                f"found for 'go_to_previous' when validating the response."
+                "found for 'stop' when validating the response."
             )
 
     @BaseRequest.response.setter
@@ -219,8 +218,8 @@ class NautilusNavigator(InteractiveMethod):
         self._reachable_ub = self._nadir
         self._reachable_lb = self._ideal
 
-        # currently reachable solution as a list of indices of the Pareto front
-        self._reachable_idx = list(range(0, self._pareto_front.shape[0]))
+        # currently reachable solution as an array of indices of the Pareto front
+        self._reachable_idx = np.arange(self._pareto_front.shape[0])
 
         # current iteration step number
         self._step_number = 1
@@ -377,10 +376,10 @@ class NautilusNavigator(InteractiveMethod):
             self._reference_point = ref_point
             self._current_speed = speed
 
+        projection = self._pareto_front[self._projection_index]
+
         new_nav = self.calculate_navigation_point(
-            self._pareto_front[self._projection_index],
-            self._navigation_point,
-            self._steps_remaining,
+            projection, self._navigation_point, self._steps_remaining,
         )
 
         self._navigation_point = new_nav
@@ -393,9 +392,7 @@ class NautilusNavigator(InteractiveMethod):
         self._reachable_ub = new_ub
 
         new_dist = self.calculate_distance(
-            self._navigation_point,
-            self._pareto_front[self._projection_index],
-            self._nadir,
+            self._navigation_point, projection, self._nadir,
         )
 
         self._distance = new_dist
@@ -508,25 +505,27 @@ class NautilusNavigator(InteractiveMethod):
             Tuple[np.ndarray, np.ndarray]: The lower and upper bounds.
         """
         _pareto_front = np.atleast_2d(pareto_front)
-        new_lower_bounds = np.zeros(_pareto_front.shape[1])
-        new_upper_bounds = np.zeros(_pareto_front.shape[1])
 
-        # TODO: vectorize this loop
-        for r in range(_pareto_front.shape[1]):
-            mask = np.zeros(_pareto_front.shape[1], dtype=bool)
-            mask[r] = True
+        # mark the objectives in which each point exceeds the navigation point
+        exceeds = ~(_pareto_front <= nav_point)
+        n_exceeds = np.sum(exceeds, axis=1, keepdims=True)
 
-            subject_to = _pareto_front[:, ~mask].reshape(
-                (_pareto_front.shape[0], _pareto_front.shape[1] - 1)
-            )
-
-            con_mask = np.all(subject_to <= nav_point[~mask], axis=1)
+        # a point bounds the r:th objective when it does not exceed the
+        # navigation point in any of the other objectives
+        con_mask = (n_exceeds - exceeds) == 0
 
-            min_val = np.min(_pareto_front[con_mask, mask])
-            max_val = np.max(_pareto_front[con_mask, mask])
+        if not np.all(np.any(con_mask, axis=0)):
+            raise NautilusNavigatorException(
+                "No point on the Pareto front is reachable from the navigation point "
+                f"{nav_point} in some of the objectives."
+            )
 
-            new_lower_bounds[r] = min_val
-            new_upper_bounds[r] = max_val
+        new_lower_bounds = np.min(
+            _pareto_front, axis=0, where=con_mask, initial=np.inf
+        )
+        new_upper_bounds = np.max(
+            _pareto_front, axis=0, where=con_mask, initial=-np.inf
+        )
 
         return new_lower_bounds, new_upper_bounds
 
@@ -550,60 +549,3 @@ class NautilusNavigator(InteractiveMethod):
         dist = (nom / denom) * 100
 
         return dist
-
-
-if __name__ == "__main__":
-    # front = np.array([[1, 2, 3], [2, 3, 4], [2, 2, 3], [3, 2, 1]], dtype=float)
-    # ideal = np.zeros(3)
-    # nadir = np.ones(3) * 5
-    f1 = np.linspace(1, 100, 50)
-    f2 = f1[::-1] ** 2
-
-    front = np.stack((f1, f2)).T
-    ideal = np.min(front, axis=0)
-    nadir = np.max(front, axis=0)
-
-    method = NautilusNavigator((front), ideal, nadir)
-
-    req = method.start()
-    print(req.content["reachable_lb"])
-    print(req.content["navigation_point"])
-    print(req.content["reachable_ub"])
-
-    response = {
-        "reference_point": np.array([50, 6000]),
-        "speed": 5,
-        "go_to_previous": False,
-        "stop": False,
-    }
-    req.response = response
-    req = method.iterate(req)
-    req.response = response
-
-    req1 = req
-
-    import time
-
-    while req.content["steps_remaining"] > 1:
-        time.sleep(1 / req.content["current_speed"])
-        req = method.iterate(req)
-        req.response = response
-        print(req.content["steps_remaining"])
-        print(req.content["reachable_lb"])
-        print(req.content["navigation_point"])
-        print(req.content["reachable_ub"])
-
-    req1.response["go_to_previous"] = True
-    req = method.iterate(req1)
-    req.response = response
-    req.response["go_to_previous"] = False
-
-    while req.content["steps_remaining"] > 1:
-        time.sleep(1 / req.content["current_speed"])
-        req = method.iterate(req)
-        req.response = response
-        print(req.content["steps_remaining"])
-        print(req.content["reachable_lb"])
-        print(req.content["navigation_point"])
-        print(req.content["reachable_ub"])
-    print(req)
@@ -3,6 +3,7 @@
 """
 
 __all__ = [
+    "CachedEvaluator",
     "payoff_table_method",
     "payoff_table_method_general",
     "solve_pareto_front_representation",
@@ -12,6 +13,7 @@ __all__ = [
 
 
 from desdeo_mcdm.utilities.solvers import (
+    CachedEvaluator,
     payoff_table_method,
     payoff_table_method_general,
     solve_pareto_front_representation,
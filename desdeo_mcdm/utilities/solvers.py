@@ -2,10 +2,11 @@
 
 """
 import logging
+from collections import OrderedDict
 from typing import Callable, Optional, Tuple, Union
 
 import numpy as np
-from desdeo_problem.Problem import MOProblem
+from desdeo_problem.Problem import EvaluationResults, MOProblem
 from desdeo_tools.scalarization.ASF import ASFBase, PointMethodASF
 from desdeo_tools.scalarization.Scalarizer import Scalarizer
 from desdeo_tools.solver.ScalarSolver import ScalarMethod, ScalarMinimizer
@@ -94,6 +95,80 @@ def payoff_table_method_general(
     return ideal, nadir
 
 
+class CachedEvaluator:
+    """Evaluates a MOProblem and caches the results of the most recent
+    evaluations. Solvers tend to request the objective and constraint values
+    separately for the same decision variables, which would otherwise evaluate
+    the problem twice.
+
+    Args:
+        problem (MOProblem): The problem to evaluate.
+        cache_size (int, optional): The number of most recent
+            evaluations to keep in the cache. Defaults to 256.
+    """
+
+    def __init__(self, problem: MOProblem, cache_size: int = 256):
+        self._problem = problem
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+
+    def evaluate(self, x: np.ndarray) -> EvaluationResults:
+        """Evaluates the problem with the given decision variables, or returns
+        the cached results of an earlier evaluation with the same variables.
+
+        Args:
+            x (np.ndarray): The decision variables to evaluate the problem with.
+
+        Returns:
+            EvaluationResults: The results of evaluating the problem. The
+            arrays in the results are read-only, since they are shared with
+            other callers through the cache.
+        """
+        x = np.asarray(x)
+        key = (x.shape, x.dtype.str, x.tobytes())
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        results = self._problem.evaluate(x)
+
+        # the cached arrays are shared between callers, make sure none of them can modify the arrays in place
+        for values in results:
+            if isinstance(values, np.ndarray):
+                values.flags.writeable = False
+
+        self._cache[key] = results
+
+        if len(self._cache) > self._cache_size:
+            # drop the least recently used evaluation
+            self._cache.popitem(last=False)
+
+        return results
+
+    def objectives(self, x: np.ndarray) -> np.ndarray:
+        """Evaluates the objective values of the problem. See `evaluate`.
+
+        Args:
+            x (np.ndarray): The decision variables to evaluate the objectives with.
+
+        Returns:
+            np.ndarray: The objective values.
+        """
+        return self.evaluate(x).objectives
+
+    def constraints(self, x: np.ndarray) -> np.ndarray:
+        """Evaluates the constraint values of the problem. See `evaluate`.
+
+        Args:
+            x (np.ndarray): The decision variables to evaluate the constraints with.
+
+        Returns:
+            np.ndarray: The constraint values.
+        """
+        return self.evaluate(x).constraints.squeeze()
+
+
 def payoff_table_method(
     problem: MOProblem,
     initial_guess: Optional[np.ndarray] = None,
@@ -113,13 +188,15 @@ def payoff_table_method(
     Returns:
         Tuple[np.ndarray, np.ndarray]: The ideal and nadir points
     """
+    evaluator = CachedEvaluator(problem)
+
     if problem.n_of_constraints > 0:
-        constraints = lambda x: problem.evaluate(x).constraints.squeeze()
+        constraints = evaluator.constraints
     else:
         constraints = None
 
     return payoff_table_method_general(
-        lambda xs: problem.evaluate(xs).objectives,
+        evaluator.objectives,
         problem.n_of_objectives,
         problem.get_variable_bounds(),
         constraints,
@@ -227,9 +304,17 @@ def solve_pareto_front_representation_general(
     p_front_objectives = np.zeros(z_mesh.shape)
     p_front_variables = np.zeros((len(p_front_objectives), len(variable_bounds.squeeze())))
 
+    # consecutive reference points in the mesh are close to each other, so the
+    # previous solution is used as the initial guess for the next one. The
+    # first guess is the middle of the variable bounds, or the value closest to
+    # zero within the bounds when a variable is unbounded.
+    bounded = np.all(np.isfinite(variable_bounds), axis=1)
+    x0 = np.clip(0.0, variable_bounds[:, 0], variable_bounds[:, 1])
+    x0[bounded] = np.mean(variable_bounds[bounded], axis=1)
+
     for i, z in enumerate(z_mesh):
         scalarizer._scalarizer_args = {"reference_point": z}
-        res = solver.minimize(None)
+        res = solver.minimize(x0)
 
         if not res["success"]:
             print("Non successfull optimization")
@@ -237,6 +322,8 @@ def solve_pareto_front_representation_general(
             p_front_variables[i] = np.nan
             continue
 
+        x0 = res["x"]
+
         # check for dominance, accept only non-dominated solutions
         f_i = objective_evaluator(res["x"])
         if not np.all(f_i > p_front_objectives[:i][~np.all(np.isnan(p_front_objectives[:i]), axis=1)]):
@@ -294,13 +381,15 @@ def solve_pareto_front_representation(
         the Pareto optimal variable values, and the corresponsing objective
         values.
     """
+    evaluator = CachedEvaluator(problem)
+
     if problem.n_of_constraints > 0:
-        constraints = lambda x: problem.evaluate(x).constraints.squeeze()
+        constraints = evaluator.constraints
     else:
         constraints = None
 
     var_values, obj_values = solve_pareto_front_representation_general(
-        lambda x: problem.evaluate(x).objectives,
+        evaluator.objectives,
         problem.n_of_objectives,
         problem.get_variable_bounds(),
         step,
@@ -312,51 +401,3 @@ def solve_pareto_front_representation(
     )
 
     return var_values, obj_values * problem._max_multiplier
-
-
-if __name__ == "__main__":
-    # # create the problem
-    # def f_1(x):
-    #     res = 4.07 + 2.27 * x[:, 0]
-    #     return -res
-
-    # def f_2(x):
-    #     res = (
-    #         2.60
-    #         + 0.03 * x[:, 0]
-    #         + 0.02 * x[:, 1]
-    #         + 0.01 / (1.39 - x[:, 0] ** 2)
-    #         + 0.30 / (1.39 - x[:, 1] ** 2)
-    #     )
-    #     return -res
-
-    # def f_3(x):
-    #     res = 8.21 - 0.71 / (1.09 - x[:, 0] ** 2)
-    #     return -res
-
-    # def f_4(x):
-    #     res = 0.96 - 0.96 / (1.09 - x[:, 1] ** 2)
-    #     return -res
-
-    # def f_5(x):
-    #     return np.max([np.abs(x[:, 0] - 0.65), np.abs(x[:, 1] - 0.65)], axis=0)
-
-    # def c_1(x, f=None):
-    #     x = x.squeeze()
-    #     return (x[0] + x[1]) - 0.2
-
-    # f1 = _ScalarObjective(name="f1", evaluator=f_1)
-    # f2 = _ScalarObjective(name="f2", evaluator=f_2)
-    # f3 = _ScalarObjective(name="f3", evaluator=f_3)
-    # f4 = _ScalarObjective(name="f4", evaluator=f_4)
-    # f5 = _ScalarObjective(name="f5", evaluator=f_5)
-    # c1 = ScalarConstraint("c1", 2, 5, evaluator=c_1)
-    # varsl = variable_builder(
-    #     ["x_1", "x_2"],
-    #     initial_values=[0.5, 0.5],
-    #     lower_bounds=[0.3, 0.3],
-    #     upper_bounds=[1.0, 1.0],
-    # )
-    # problem = MOProblem(variables=varsl, objectives=[f1, f2, f3, f4, f5],)
-
-    pass
@@ -0,0 +1,44 @@
+"""Runs E-NAUTILUS on a simple biobjective Pareto front.
+
+"""
+import numpy as np
+
+from desdeo_mcdm.interactive.ENautilus import ENautilus
+
+if __name__ == "__main__":
+    # front = np.array([[1, 2, 3], [2, 3, 4], [2, 2, 3], [3, 2, 1]], dtype=float)
+    # ideal = np.zeros(3)
+    # nadir = np.ones(3) * 5
+    f1 = np.linspace(1, 100, 50)
+    f2 = f1[::-1] ** 2
+
+    front = np.stack((f1, f2)).T
+    ideal = np.min(front, axis=0)
+    nadir = np.max(front, axis=0)
+
+    method = ENautilus((front), ideal, nadir)
+
+    req = method.start()
+
+    n_iterations = 11
+    n_points = 4
+
+    req.response = {
+        "n_iterations": n_iterations,
+        "n_points": n_points,
+    }
+
+    req = method.iterate(req)
+    req.response = {"preferred_point_index": 0}
+
+    while method._n_iterations_left > 1:
+        print(method._n_iterations_left)
+        req = method.iterate(req)
+        print(req.content["points"])
+        req.response = {"preferred_point_index": 0}
+
+    print(method._n_iterations_left)
+    req = method.iterate(req)
+    print(method._n_iterations_left)
+    print(method._distance)
+    print(req.content["solution"])
@@ -0,0 +1,62 @@
+"""Runs NAUTILUS Navigator on a simple biobjective Pareto front.
+
+"""
+import time
+
+import numpy as np
+
+from desdeo_mcdm.interactive.NautilusNavigator import NautilusNavigator
+
+if __name__ == "__main__":
+    # front = np.array([[1, 2, 3], [2, 3, 4], [2, 2, 3], [3, 2, 1]], dtype=float)
+    # ideal = np.zeros(3)
+    # nadir = np.ones(3) * 5
+    f1 = np.linspace(1, 100, 50)
+    f2 = f1[::-1] ** 2
+
+    front = np.stack((f1, f2)).T
+    ideal = np.min(front, axis=0)
+    nadir = np.max(front, axis=0)
+
+    method = NautilusNavigator((front), ideal, nadir)
+
+    req = method.start()
+    print(req.content["reachable_lb"])
+    print(req.content["navigation_point"])
+    print(req.content["reachable_ub"])
+
+    response = {
+        "reference_point": np.array([50, 6000]),
+        "speed": 5,
+        "go_to_previous": False,
+        "stop": False,
+    }
+    req.response = response
+    req = method.iterate(req)
+    req.response = response
+
+    req1 = req
+
+    while req.content["steps_remaining"] > 1:
+        time.sleep(1 / req.content["current_speed"])
+        req = method.iterate(req)
+        req.response = response
+        print(req.content["steps_remaining"])
+        print(req.content["reachable_lb"])
+        print(req.content["navigation_point"])
+        print(req.content["reachable_ub"])
+
+    req1.response["go_to_previous"] = True
+    req = method.iterate(req1)
+    req.response = response
+    req.response["go_to_previous"] = False
+
+    while req.content["steps_remaining"] > 1:
+        time.sleep(1 / req.content["current_speed"])
+        req = method.iterate(req)
+        req.response = response
+        print(req.content["steps_remaining"])
+        print(req.content["reachable_lb"])
+        print(req.content["navigation_point"])
+        print(req.content["reachable_ub"])
+    print(req)
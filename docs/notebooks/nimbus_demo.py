@@ -0,0 +1,71 @@
+"""Runs synchronous NIMBUS on a five-objective problem with two variables and one constraint.
+
+"""
+import numpy as np
+from desdeo_problem.Constraint import ScalarConstraint
+from desdeo_problem.Objective import _ScalarObjective
+from desdeo_problem.Problem import MOProblem
+from desdeo_problem.Variable import variable_builder
+
+from desdeo_mcdm.interactive.NIMBUS import NIMBUS
+
+if __name__ == "__main__":
+    # create the problem
+    def f_1(x):
+        res = 4.07 + 2.27 * x[:, 0]
+        return -res
+
+    def f_2(x):
+        res = 2.60 + 0.03 * x[:, 0] + 0.02 * x[:, 1] + 0.01 / (1.39 - x[:, 0] ** 2) + 0.30 / (1.39 - x[:, 1] ** 2)
+        return -res
+
+    def f_3(x):
+        res = 8.21 - 0.71 / (1.09 - x[:, 0] ** 2)
+        return -res
+
+    def f_4(x):
+        res = 0.96 - 0.96 / (1.09 - x[:, 1] ** 2)
+        return -res
+
+    def f_5(x):
+        return np.max([np.abs(x[:, 0] - 0.65), np.abs(x[:, 1] - 0.65)], axis=0)
+
+    def c_1(x, f=None):
+        x = x.squeeze()
+        return (x[0] + x[1]) - 0.5
+
+    f1 = _ScalarObjective(name="f1", evaluator=f_1)
+    f2 = _ScalarObjective(name="f2", evaluator=f_2)
+    f3 = _ScalarObjective(name="f3", evaluator=f_3)
+    f4 = _ScalarObjective(name="f4", evaluator=f_4)
+    f5 = _ScalarObjective(name="f5", evaluator=f_5)
+    varsl = variable_builder(
+        ["x_1", "x_2"], initial_values=[0.5, 0.5], lower_bounds=[0.3, 0.3], upper_bounds=[1.0, 1.0],
+    )
+    c1 = ScalarConstraint("c1", 2, 5, evaluator=c_1)
+    problem = MOProblem(variables=varsl, objectives=[f1, f2, f3, f4, f5], constraints=[c1])
+
+    method = NIMBUS(problem, scalar_method="scipy_de")
+    reqs = method.request_classification()[0]
+
+    response = {}
+    response["classifications"] = ["<", "<=", "=", ">=", "0"]
+    response["levels"] = [-6, -3, -5, 8, 0.349]
+    response["number_of_solutions"] = 3
+    reqs.response = response
+    res_1 = method.iterate(reqs)[0]
+    res_1.response = {"indices": []}
+
+    res_2 = method.iterate(res_1)[0]
+    response = {}
+    response["indices"] = []
+    response["number_of_desired_solutions"] = 0
+    res_2.response = response
+
+    res_3 = method.iterate(res_2)[0]
+    response_pref = {}
+    response_pref["index"] = 1
+    response_pref["continue"] = True
+    res_3.response = response_pref
+
+    res_4 = method.iterate(res_3)
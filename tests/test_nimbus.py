@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from desdeo_problem.Objective import _ScalarObjective
+from desdeo_problem.Problem import MOProblem
+from desdeo_problem.Variable import variable_builder
+
+from desdeo_mcdm.interactive.NIMBUS import NIMBUS
+
+
+@pytest.fixture
+def method():
+    # f_1 prefers x = 0, f_2 prefers x = 2
+    f1 = _ScalarObjective(name="f1", evaluator=lambda x: x[:, 0] ** 2)
+    f2 = _ScalarObjective(name="f2", evaluator=lambda x: (x[:, 0] - 2) ** 2)
+    varsl = variable_builder(["x"], initial_values=[1.0], lower_bounds=[0.0], upper_bounds=[2.0])
+    problem = MOProblem(variables=varsl, objectives=[f1, f2], ideal=np.array([0.0, 0.0]), nadir=np.array([4.0, 4.0]))
+
+    return NIMBUS(problem, scalar_method="scipy_de")
+
+
+def test_impaire_until_level_is_respected(method):
+    level = 2.25
+
+    # improve f_1, let f_2 impair until the level
+    request = method.request_classification()[0]
+    request.response = {"classifications": ["<", ">="], "levels": [0.0, level], "number_of_solutions": 1}
+
+    save_request = method.iterate(request)[0]
+    objectives = save_request.content["objectives"][0]
+
+    # without the bound on f_2, f_1 would be improved all the way to x = 0 where f_2 = 4
+    assert objectives[1] <= level + 1e-3
+    assert objectives[0] == pytest.approx(0.25, abs=1e-2)